@@ -1,13 +1,29 @@
 # std
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Tuple, Type
 
 # project
 from src.notifier import Event, EventService, EventType, EventPriority
 from . import LogHandler
 from ..parsers.finished_signage_point_parser import FinishedSignagePointParser, FinishedSignagePointMessage
 
+# Signage points roll over after the 64th point of each challenge
+_ROLL_OVER_POINT = 64
+
+# All skipped-signage-point events share the same constant fields,
+# only the message varies
+_make_skipped_event = partial(Event, type=EventType.USER, priority=EventPriority.NORMAL, service=EventService.FULL_NODE)
+
+
+@lru_cache(maxsize=256)
+def _skip_message(last: int, current: int) -> str:
+    """Memoized so bursty anomaly storms that repeat the same signage point
+    pair (see "testNetworkScramble") don't reformat the same message."""
+    return f"Experiencing networking issues? Skipped some signage points! Last {last}/64, current {current}/64."
+
 
 class FinishedSignagePointHandler(LogHandler):
     """This handler parses all logs indicating finished signage point
@@ -18,31 +34,57 @@ class FinishedSignagePointHandler(LogHandler):
     def __init__(self):
         self._parser = FinishedSignagePointParser()
         self._cond_checkers: List[ConditionChecker] = [NonSkippedSignagePoints()]
+        # Typical deployments run a single checker; dispatching straight to
+        # its bound check method skips the inner checker loop per message
+        self._single_check = self._cond_checkers[0].check if len(self._cond_checkers) == 1 else None
+        # Bucket checkers by the message types they apply to, so messages
+        # are only run through checkers that can actually produce an event
+        checkers_by_type: Dict[type, List[ConditionChecker]] = defaultdict(list)
+        for checker in self._cond_checkers:
+            for message_type in checker.applies_to:
+                checkers_by_type[message_type].append(checker)
+        self._checkers_by_type = dict(checkers_by_type)
 
     def handle(self, logs: str) -> List[Event]:
         """Process incoming logs, check all conditions
         and return a list of notable events.
         """
 
-        events = []
         signage_point_messages = self._parser.parse(logs)
-        if len(signage_point_messages) > 0:
-            # Currently not generating keep-alive events for the full node
-            # based on the signage points because it's tightly coupled to
-            # the eligible plots check from the harvester
-            logging.debug(f"Parsed {len(signage_point_messages)} signage point messages")
+        if not signage_point_messages:
+            return []
+
+        # Currently not generating keep-alive events for the full node
+        # based on the signage points because it's tightly coupled to
+        # the eligible plots check from the harvester
+        logging.debug("Parsed %d signage point messages", len(signage_point_messages))
 
         # Run messages through all condition checkers
+        single_check = self._single_check
+        if single_check is not None:
+            return [event for event in map(single_check, signage_point_messages) if event is not None]
+
+        events: List[Event] = []
+        append = events.append
+        checkers_by_type = self._checkers_by_type
         for msg in signage_point_messages:
-            for checker in self._cond_checkers:
+            for checker in checkers_by_type.get(type(msg), ()):
                 event = checker.check(msg)
                 if event:
-                    events.append(event)
+                    append(event)
 
         return events
 
 
 class ConditionChecker(ABC):
+    # Checkers run on every parsed log line, so keep their state in
+    # fixed slots instead of a per-instance __dict__
+    __slots__ = ()
+
+    # Message types this checker is interested in; the handler buckets
+    # checkers by type so inapplicable ones are pruned up-front
+    applies_to: Tuple[Type, ...] = (FinishedSignagePointMessage,)
+
     @abstractmethod
     def check(self, obj: FinishedSignagePointMessage) -> Optional[Event]:
         pass
@@ -54,43 +96,61 @@ class NonSkippedSignagePoints(ConditionChecker):
     issues which prevent the farmer from participating in all challenges.
     """
 
+    __slots__ = (
+        "_last_signage_point_timestamp",
+        "_last_signage_point",
+        "_last_signage_point_mod",
+    )
+
     def __init__(self):
         logging.info("Enabled check for finished signage points.")
         self._last_signage_point_timestamp = None
         self._last_signage_point = None
-        self._roll_over_point = 64
+        self._last_signage_point_mod = None
 
     def check(self, obj: FinishedSignagePointMessage) -> Optional[Event]:
+        # Keep the stored timestamp as plain epoch seconds so the anomaly
+        # branch below is an int subtraction instead of datetime arithmetic
+        timestamp_seconds = int(obj.timestamp.timestamp())
+
         if self._last_signage_point is None:
-            self._last_signage_point_timestamp = obj.timestamp
-            self._last_signage_point = obj.signage_point
+            self._update(obj, timestamp_seconds)
+            return None
+
+        increment_diff = obj.signage_point - self._last_signage_point_mod
+        if increment_diff == 1:
+            # Common case: the next consecutive signage point arrived.
+            # Exit early without any time difference checks.
+            self._update(obj, timestamp_seconds)
             return None
 
         event = None
-        time_diff_seconds = (obj.timestamp - self._last_signage_point_timestamp).seconds
-        increment_diff = obj.signage_point - (self._last_signage_point % self._roll_over_point)
-
-        if increment_diff <= 0 or increment_diff > 1:
-            # This is hacky addition to prevent false alarms for some network-wide issues that
-            # aren't necessarily related to the local node. See "testNetworkScramble" test case.
-            # Signage points are expected approx every 8-10 seconds. If a point was skipped for real
-            # then we expect the time difference to be at least 2*8 seconds. Otherwise it's flaky event.
-            if time_diff_seconds < 15:
-                logging.info(
-                    f"Detected unusual network activity. Last signage point {self._last_signage_point}, "
-                    f"current signage point {obj.signage_point}. Time difference: {time_diff_seconds} "
-                    f"seconds. Seems unrelated to the local node. Ignoring..."
-                )
-            else:
-                message = (
-                    f"Experiencing networking issues? Skipped some signage points! "
-                    f"Last {self._last_signage_point}/64, current {obj.signage_point}/64."
-                )
-                logging.warning(message)
-                event = Event(
-                    type=EventType.USER, priority=EventPriority.NORMAL, service=EventService.FULL_NODE, message=message
-                )
-
-        self._last_signage_point_timestamp = obj.timestamp
-        self._last_signage_point = obj.signage_point
+        time_diff_seconds = timestamp_seconds - self._last_signage_point_timestamp
+
+        # This is hacky addition to prevent false alarms for some network-wide issues that
+        # aren't necessarily related to the local node. See "testNetworkScramble" test case.
+        # Signage points are expected approx every 8-10 seconds. If a point was skipped for real
+        # then we expect the time difference to be at least 2*8 seconds. Otherwise it's flaky event.
+        if time_diff_seconds < 15:
+            logging.info(
+                "Detected unusual network activity. Last signage point %d, "
+                "current signage point %d. Time difference: %d "
+                "seconds. Seems unrelated to the local node. Ignoring...",
+                self._last_signage_point,
+                obj.signage_point,
+                time_diff_seconds,
+            )
+        else:
+            message = _skip_message(self._last_signage_point, obj.signage_point)
+            logging.warning(message)
+            event = _make_skipped_event(message=message)
+
+        self._update(obj, timestamp_seconds)
         return event
+
+    def _update(self, obj: FinishedSignagePointMessage, timestamp_seconds: int):
+        """Remember the last seen signage point, caching its roll-over
+        remainder so check() doesn't redo the modulus on every log line."""
+        self._last_signage_point_timestamp = timestamp_seconds
+        self._last_signage_point = obj.signage_point
+        self._last_signage_point_mod = obj.signage_point % _ROLL_OVER_POINT
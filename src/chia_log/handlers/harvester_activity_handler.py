@@ -35,8 +35,9 @@ class HarvesterActivityHandler(LogHandler):
 
         # Create a keep-alive event if any logs indicating
         # activity have been successfully parsed
-        if len(activity_messages) > 0:
-            logging.debug(f"Parsed {len(activity_messages)} activity messages")
+        message_count = len(activity_messages)
+        if message_count:
+            logging.debug("Parsed %d activity messages", message_count)
             events.append(
                 Event(
                     type=EventType.KEEPALIVE, priority=EventPriority.NORMAL, service=EventService.HARVESTER, message=""
@@ -97,7 +98,7 @@ class TimeSinceLastFarmEvent(HarvesterConditionChecker):
         elif seconds_since_last > self._info_threshold:
             # This threshold seems to be surpassed multiple times per day
             # on the current network. So it only generates an INFO log.
-            logging.info(f"Last farming event was {seconds_since_last} seconds ago. This is unusual.")
+            logging.info("Last farming event was %d seconds ago. This is unusual.", seconds_since_last)
 
         self._last_timestamp = obj.timestamp
         return event
@@ -115,7 +116,7 @@ class NonDecreasingPlots(HarvesterConditionChecker):
 
     def check(self, obj: HarvesterActivityMessage) -> Optional[Event]:
         if obj.total_plots_count > self._max_farmed_plots:
-            logging.info(f"Detected new plots. Farming with {obj.total_plots_count} plots.")
+            logging.info("Detected new plots. Farming with %d plots.", obj.total_plots_count)
             self._max_farmed_plots = obj.total_plots_count
 
         event = None
@@ -17,30 +17,53 @@ class PushoverNotifier(Notifier):
             self.user = config["user_key"]
         except KeyError as key:
             logging.error(f"Invalid config.yaml. Missing key: {key}")
+        # Keep a single keep-alive connection around so that a batch of
+        # N events doesn't pay N full TCP + TLS handshakes
+        self._conn = http.client.HTTPSConnection("api.pushover.net", 443)
+
+    def _request(self, body: str, headers: dict) -> int:
+        """Issue a single request over the shared connection, reconnecting
+        and retrying once in case the keep-alive socket went stale.
+        """
+        for attempt in range(2):
+            try:
+                self._conn.request("POST", "/1/messages.json", body, headers)
+                response = self._conn.getresponse()
+                status = response.status
+                response.read()  # drain the body so the connection can be reused
+                return status
+            except (http.client.HTTPException, ConnectionError, OSError) as e:
+                self._conn.close()
+                self._conn = http.client.HTTPSConnection("api.pushover.net", 443)
+                if attempt > 0:
+                    logging.error(f"Failed sending event to user: {e}")
+        return -1
 
     def send_events_to_user(self, events: List[Event]) -> bool:
+        user_events = [event for event in events if event.type is EventType.USER]
+        if not user_events:
+            return False
+
         errors = False
-        for event in events:
-            if event.type == EventType.USER:
-                conn = http.client.HTTPSConnection("api.pushover.net:443")
-                conn.request(
-                    "POST",
-                    "/1/messages.json",
-                    urllib.parse.urlencode(
-                        {
-                            "token": self.token,
-                            "user": self.user,
-                            "title": f"{self._title_prefix} {event.service.name}",
-                            "message": event.message,
-                            "priority": event.priority.value,
-                        }
-                    ),
-                    {"Content-type": "application/x-www-form-urlencoded"},
-                )
-                response = conn.getresponse()
-                if response.getcode() != 200:
-                    logging.warning(f"Problem sending event to user, code: {response.getcode()}")
-                    errors = True
-                conn.close()
+        for event in user_events:
+            body = urllib.parse.urlencode(
+                {
+                    "token": self.token,
+                    "user": self.user,
+                    "title": f"{self._title_prefix} {event.service.name}",
+                    "message": event.message,
+                    "priority": event.priority.value,
+                }
+            )
+            status = self._request(body, {"Content-type": "application/x-www-form-urlencoded"})
+            if status != 200:
+                logging.warning(f"Problem sending event to user, code: {status}")
+                errors = True
 
         return errors
+
+    def close(self):
+        self._conn.close()
+
+    def __del__(self):
+        self.close()
@@ -1,12 +1,20 @@
 # std
-import http.client
+import asyncio
 import logging
 import urllib.parse
-from typing import List
+from typing import TYPE_CHECKING, List
 
 # project
 from . import Notifier, Event, EventType, EventPriority
 
+if TYPE_CHECKING:
+    # lib
+    import httpx
+
+_SIREN = "\U0001F6A8"
+_SYMBOL_BY_PRIORITY = {EventPriority.HIGH: _SIREN, EventPriority.NORMAL: "", EventPriority.LOW: ""}
+_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
 
 class TelegramNotifier(Notifier):
     def __init__(self, title_prefix: str, config: dict):
@@ -17,30 +25,51 @@ class TelegramNotifier(Notifier):
             self.chat_id = config["chat_id"]
         except KeyError as key:
             logging.error(f"Invalid config.yaml. Missing key: {key}")
+        self._url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        # chat_id and parse_mode never change, so encode them once and
+        # only append the varying fields per event
+        self._static_qs = urllib.parse.urlencode([("chat_id", self.chat_id), ("parse_mode", "HTML")])
+        # This module is always imported by NotifyManager, but httpx is
+        # only worth loading once the Telegram notifier is enabled - defer
+        # the import to keep startup cheap for everyone else
+        import httpx
+
+        self._httpx = httpx
+        self._limits = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+
+    def _encode_event(self, event: Event) -> str:
+        """Build the urlencoded sendMessage body for a single event."""
+        symbol = _SYMBOL_BY_PRIORITY[event.priority]
+        text = "".join(["<b>", symbol, " ", self._title_prefix, " ", event.service.name, "</b>\n", event.message])
+        fields = [
+            ("text", text),
+            ("disable_notification", "true" if event.priority is EventPriority.LOW else "false"),
+        ]
+        return self._static_qs + "&" + urllib.parse.urlencode(fields)
+
+    async def _send_one(self, client: "httpx.AsyncClient", event: Event) -> bool:
+        """Send a single event to the user. Returns True on failure."""
+        body = self._encode_event(event)
+        try:
+            response = await client.post(self._url, content=body, headers=_HEADERS)
+        except self._httpx.HTTPError as e:
+            logging.error(f"Failed sending event to user: {e}")
+            return True
+        if response.status_code != 200:
+            logging.warning(f"Problem sending event to user, code: {response.status_code}")
+            return True
+        return False
+
+    async def _async_send(self, events: List[Event]) -> bool:
+        # HTTP/2 multiplexes all concurrent sendMessage calls of a batch
+        # over a single TLS connection - one handshake per batch, no
+        # head-of-line blocking between events
+        async with self._httpx.AsyncClient(http2=True, limits=self._limits, timeout=10) as client:
+            results = await asyncio.gather(*(self._send_one(client, event) for event in events))
+        return any(results)
 
     def send_events_to_user(self, events: List[Event]) -> bool:
-        errors = False
-        for event in events:
-            if event.type == EventType.USER:
-                symbol = "\U0001F6A8" if event.priority == EventPriority.HIGH else ""
-                conn = http.client.HTTPSConnection("api.telegram.org:443")
-                conn.request(
-                    "POST",
-                    f"/bot{self.token}/sendMessage",
-                    urllib.parse.urlencode(
-                        {
-                            "chat_id": self.chat_id,
-                            "parse_mode": "HTML",
-                            "text": f"<b>{symbol} {self._title_prefix} {event.service.name}</b>\n{event.message}",
-                            "disable_notification": event.priority == EventPriority.LOW,
-                        }
-                    ),
-                    {"Content-type": "application/x-www-form-urlencoded"},
-                )
-                response = conn.getresponse()
-                if response.getcode() != 200:
-                    logging.warning(f"Problem sending event to user, code: {response.getcode()}")
-                    errors = True
-                conn.close()
-
-        return errors
+        user_events = [event for event in events if event.type is EventType.USER]
+        if not user_events:
+            return False
+        return asyncio.run(self._async_send(user_events))